@@ -1,15 +1,130 @@
+import ast
+import copy
+import socket
 import requests
 import time
 import json
+import orjson
 import statistics
-from typing import Dict, Any
+import threading
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple
+from requests.adapters import HTTPAdapter
 from tabulate import tabulate
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait
 from dynamic_content_generator import DynamicContentGenerator
 
+# Disable Nagle's algorithm so small requests are sent immediately instead of
+# waiting to be coalesced, and keep idle pooled connections alive
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+class _LowLatencyAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections are opened with _SOCKET_OPTIONS."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        kwargs["socket_options"] = _SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+# Shared session so keep-alive connections are reused across requests (and
+# across the worker threads of a concurrent run) instead of paying the
+# TCP/TLS handshake on every call. Its adapter keeps one pool per
+# (scheme, host, port), shared by every APITester.
+_SESSION = requests.Session()
+_ADAPTER = None
+# Connections each per-host pool keeps, as last passed to _mount_adapter
+_POOL_MAXSIZE = 0
+
+def _mount_adapter(pool_maxsize: int) -> None:
+    """Mount a fresh adapter whose per-host pools keep up to pool_maxsize connections."""
+    global _ADAPTER, _POOL_MAXSIZE
+    old_adapter = _ADAPTER
+    _POOL_MAXSIZE = pool_maxsize
+    _ADAPTER = _LowLatencyAdapter(pool_connections=32, pool_maxsize=pool_maxsize,
+                                  max_retries=0)
+    _SESSION.mount("http://", _ADAPTER)
+    _SESSION.mount("https://", _ADAPTER)
+    if old_adapter:
+        old_adapter.close()
+
+# Shared HTTP/2 client, created on first use since httpx is optional
+_HTTP2_CLIENT = None
+
+def _mount_http2_client(max_connections: int) -> None:
+    """Create the shared httpx client, replacing any previous one."""
+    global _HTTP2_CLIENT
+    import httpx  # Only needed for HTTP/2: pip install "httpx[http2]"
+    old_client = _HTTP2_CLIENT
+    _HTTP2_CLIENT = httpx.Client(
+        timeout=30,
+        transport=httpx.HTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=max_connections,
+                                max_keepalive_connections=max_connections),
+            socket_options=_SOCKET_OPTIONS
+        )
+    )
+    if old_client:
+        old_client.close()
+
+def _get_http2_client():
+    """Return the shared httpx client that multiplexes requests over HTTP/2."""
+    if _HTTP2_CLIENT is None:
+        _mount_http2_client(_POOL_MAXSIZE)
+    return _HTTP2_CLIENT
+
+def _ensure_pool_size(pool_maxsize: int) -> None:
+    """
+    Grow the shared pools of both transports so pool_maxsize threads can
+    each keep a connection.
+
+    urllib3 discards connections returned to a full pool, and httpx makes
+    requests wait for a free one, so with more workers than pooled
+    connections extra requests would pay for a new handshake or have pool
+    waiting time counted as latency. Must not be called while requests are
+    in flight.
+    """
+    if pool_maxsize > _POOL_MAXSIZE:
+        _mount_adapter(pool_maxsize)
+        if _HTTP2_CLIENT is not None:
+            _mount_http2_client(pool_maxsize)
+
+_mount_adapter(32)
+
+# Strings starting with one of these are dynamic content markers
+_MARKER_PREFIXES = ("$generate_", "$from_options(")
+
+# Case-insensitive spellings of JSON keywords accepted as marker arguments
+_ARGUMENT_KEYWORDS = {"true": True, "false": False, "null": None, "none": None}
+
+# How many requests to send between checks of the running median
+_MEDIAN_CHECK_INTERVAL = 10
+
+# orjson options for writing result files; status code counts are keyed by int
+RESULTS_JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+
+# Chunk size used when reading and discarding response bodies
+_DISCARD_CHUNK_SIZE = 64 * 1024
+
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    """Linearly interpolated percentile of an already sorted, non-empty list."""
+    position = (len(sorted_values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+@lru_cache(maxsize=None)
+def _resolve_generator(func_name: str):
+    """Look up a DynamicContentGenerator method by name (None if unknown)."""
+    generator_method = getattr(DynamicContentGenerator, func_name, None)
+    return generator_method if callable(generator_method) else None
+
 class APITester:
   def __init__(self, url: str, method: str = "GET", headers: Dict = None, 
-               body: Dict = None, params: Dict = None):
+               body: Dict = None, params: Dict = None, http2: bool = False):
       """
       Initialize API tester with request details.
 
@@ -19,164 +134,455 @@ class APITester:
           headers: HTTP headers to include in the request
           body: Request body for POST/PUT requests
           params: URL parameters for the request
+          http2: Send requests with httpx over HTTP/2, multiplexing them on
+              shared connections (falls back to HTTP/1.1 if the server does
+              not negotiate h2). Requires httpx[http2]
       """
       self.url = url
       self.method = method.upper()
-      self.headers = headers or {}
+      self.http2 = http2
+      if http2:
+          _get_http2_client()
+      # HTTP/2 forbids connection-specific headers and keeps connections
+      # open by itself
+      default_headers = {} if http2 else {"Connection": "keep-alive"}
+      self.headers = {**default_headers, **(headers or {})}
       self.body = body or {}
       self.params = params or {}
       self.response = None
       self.duration = 0
-      self.content_generator = DynamicContentGenerator()
+      # All generators are static methods, so the class itself is enough
+      self.content_generator = DynamicContentGenerator
+      # Keep a private copy of the unprocessed request data and its compiled
+      # markers so every request gets fresh dynamic content without
+      # re-parsing the markers or mutating the caller's dicts
+      self._template = copy.deepcopy({"headers": self.headers, "body": self.body,
+                                      "params": self.params})
+      self._fillers = self._compile_template(self._template)
+      self._dynamic_paths = self._container_paths(self._fillers)
+      # A body without markers is the same on every request, so serialize it
+      # once here rather than letting requests re-encode it on every call
+      self._body_bytes = None
+      if (self.method in ["POST", "PUT", "PATCH"]
+              and not any((parent_path or (key,))[0] == "body"
+                          for parent_path, key, *_ in self._fillers)):
+          self._body_bytes = json.dumps(self._template["body"]).encode()
+          headers = self._template["headers"]
+          if not any(key.lower() == "content-type" for key in headers):
+              headers["Content-Type"] = "application/json"
 
   def process_dynamic_content(self, data):
       """
       Process data structure recursively, replacing dynamic content markers.
 
       Looks for special syntax like "$generate_text()" or "$generate_uuid()" and
-      replaces them with dynamically generated content.
-      """
-      if isinstance(data, dict):
-          for key, value in list(data.items()):
-              data[key] = self.process_dynamic_content(value)
-          return data
-      elif isinstance(data, list):
-          return [self.process_dynamic_content(item) for item in data]
-      elif isinstance(data, str) and data.startswith("$generate_"):
-          # Extract function name and parameters
+      replaces them with dynamically generated content. The given data is
+      left untouched; a processed copy is returned.
+      """
+      # Box a copy of the data so compiling never rewrites the caller's
+      # dicts, and so a bare marker string has a parent to be written into
+      box = {"value": copy.deepcopy(data)}
+      fillers = self._compile_template(box)
+      box, containers = self._copy_dynamic(box, self._container_paths(fillers))
+      self._fill(containers, fillers)
+      return box["value"]
+
+  def _parse_marker(self, marker: str):
+      """
+      Split a marker like "$generate_text(min_words=2)" into its generator
+      name, positional args and keyword args.
+
+      Argument values may be any Python literal (numbers, booleans, strings,
+      lists, dicts), e.g. $from_options(["light", "dark"]). true/false/null
+      are accepted in any case and any other unquoted value is kept as a
+      string, e.g. start_date=2024-01-01. The parentheses may be left out
+      when there are no arguments, e.g. $generate_uuid.
+      """
+      func_str = marker[1:]  # Remove the $
+      func_name, _, params_str = func_str.partition("(")
+      func_name = func_name.strip()
+      if not func_name.isidentifier() or (params_str and not params_str.endswith(")")):
+          raise ValueError(f"Invalid dynamic content marker: {marker}")
+
+      args = []
+      kwargs = {}
+      for param in self._split_arguments(params_str[:-1]):
+          name, sep, value = param.partition("=")
+          if sep and name.strip().isidentifier():
+              kwargs[name.strip()] = self._parse_argument(value)
+          else:
+              args.append(self._parse_argument(param))
+      return func_name, args, kwargs
+
+  @staticmethod
+  def _split_arguments(params_str: str) -> List[str]:
+      """Split marker arguments on the commas that are not nested in brackets or quotes."""
+      params = []
+      depth = 0
+      quote = None
+      start = 0
+      for i, char in enumerate(params_str):
+          if quote:
+              if char == quote and params_str[i-1] != "\\":
+                  quote = None
+          elif char in "\"'":
+              quote = char
+          elif char in "([{":
+              depth += 1
+          elif char in ")]}":
+              depth -= 1
+          elif char == "," and depth == 0:
+              params.append(params_str[start:i])
+              start = i + 1
+      params.append(params_str[start:])
+      return [param for param in params if param.strip()]
+
+  @staticmethod
+  def _parse_argument(value: str):
+      """Convert a marker argument to a Python value, keeping unquoted text as a string."""
+      value = value.strip()
+      if value.lower() in _ARGUMENT_KEYWORDS:
+          return _ARGUMENT_KEYWORDS[value.lower()]
+      try:
+          return ast.literal_eval(value)
+      except (ValueError, SyntaxError):
+          return value
+
+  def _compile_template(self, obj) -> List[Tuple]:
+      """
+      Find every dynamic content marker in obj.
+
+      Markers are parsed and their generator resolved once, here, so that
+      per request only the generator calls themselves are left to run.
+
+      Returns:
+          List of (parent_path, key, generator_method, args, kwargs) fillers,
+          where parent_path is the tuple of keys/indexes leading to the
+          container that holds the marker under key
+      """
+      fillers = []
+      # Walk iteratively to avoid a Python call frame per nested container
+      stack = [((), obj)]
+      while stack:
+          path, container = stack.pop()
+          items = container.items() if isinstance(container, dict) else enumerate(container)
+          for key, value in items:
+              if isinstance(value, (dict, list)):
+                  stack.append((path + (key,), value))
+              elif isinstance(value, str) and value.startswith(_MARKER_PREFIXES):
+                  try:
+                      func_name, args, kwargs = self._parse_marker(value)
+                      # Get the generator method
+                      generator_method = _resolve_generator(func_name)
+                      if generator_method:
+                          fillers.append((path, key, generator_method, args, kwargs))
+                      else:
+                          container[key] = f"Unknown generator: {func_name}"
+                  except Exception as e:
+                      container[key] = f"Error generating content: {str(e)}"
+      return fillers
+
+  @staticmethod
+  def _container_paths(fillers: List[Tuple]) -> List[Tuple]:
+      """
+      List the paths of all containers on the way to a marker, parents
+      before children. Only these are copied per request; static branches
+      are shared as-is.
+      """
+      return sorted({parent_path[:i] for parent_path, *_ in fillers
+                     for i in range(1, len(parent_path) + 1)}, key=len)
+
+  @staticmethod
+  def _copy_dynamic(template: Dict, dynamic_paths: List[Tuple]):
+      """
+      Copy the dynamic containers of template, sharing everything else.
+
+      Returns:
+          (data, containers) where containers maps each copied container's
+          path to the copy, so fillers can write into their parent with a
+          single lookup
+      """
+      data = dict(template)
+      containers = {(): data}
+      for path in dynamic_paths:
+          parent = containers[path[:-1]]
+          parent[path[-1]] = containers[path] = copy.copy(parent[path[-1]])
+      return data, containers
+
+  @staticmethod
+  def _fill(containers: Dict, fillers: List[Tuple]) -> None:
+      """Write freshly generated content for each filler into its container."""
+      for parent_path, key, generator_method, args, kwargs in fillers:
           try:
-              func_str = data[1:]  # Remove the $
-              func_name = func_str.split("(")[0]
-              # Extract parameters if any
-              params_str = func_str[len(func_name)+1:-1]  # Remove function name and parentheses
-
-              # Parse parameters
-              params = {}
-              if params_str:
-                  # Handle multiple parameters separated by commas
-                  param_pairs = params_str.split(",")
-                  for pair in param_pairs:
-                      if "=" in pair:
-                          k, v = pair.split("=", 1)
-                          k = k.strip()
-                          v = v.strip()
-                          # Convert parameter value to appropriate type
-                          if v.lower() == "true":
-                              v = True
-                          elif v.lower() == "false":
-                              v = False
-                          elif v.isdigit():
-                              v = int(v)
-                          elif v.startswith('"') and v.endswith('"'):
-                              v = v[1:-1]  # Remove quotes
-                          params[k] = v
-
-              # Get the generator method
-              generator_method = getattr(self.content_generator, func_name, None)
-              if generator_method and callable(generator_method):
-                  return generator_method(**params)
-              else:
-                  return f"Unknown generator: {func_name}"
+              containers[parent_path][key] = generator_method(*args, **kwargs)
           except Exception as e:
-              return f"Error generating content: {str(e)}"
-      else:
-          return data
+              containers[parent_path][key] = f"Error generating content: {str(e)}"
+
+  def new_scratch(self):
+      """
+      Allocate scratch request data that materialize() can refill in place.
+
+      A scratch must only be used for one request at a time, e.g. one per
+      worker thread.
+      """
+      return self._copy_dynamic(self._template, self._dynamic_paths)
+
+  def materialize(self, scratch=None) -> Dict:
+      """
+      Generate fresh dynamic content for a request.
+
+      Args:
+          scratch: Scratch data from new_scratch() to fill in place, so
+              repeated requests do not copy the template again
+
+      Returns:
+          Dictionary with the "headers", "body" and "params" to send
+      """
+      data, containers = scratch or self.new_scratch()
+      self._fill(containers, self._fillers)
+      return data
 
   def prepare_request_data(self):
       """Process all request data for dynamic content before sending."""
-      self.headers = self.process_dynamic_content(self.headers)
-      self.body = self.process_dynamic_content(self.body)
-      self.params = self.process_dynamic_content(self.params)
+      data = self.materialize()
+      self.headers = data["headers"]
+      self.body = data["body"]
+      self.params = data["params"]
 
-  def send_request(self) -> requests.Response:
-      """Send a single request and measure response time."""
-      # Process dynamic content
-      self.prepare_request_data()
+  def _execute(self, headers: Dict, body, params: Dict,
+               discard_body: bool = False):
+      """
+      Send one request with the given data and measure its response time.
+
+      Args:
+          discard_body: Stream the response body and throw it away instead of
+              buffering it, for when only the status and timing are needed
+
+      Returns:
+          (response, duration, error) tuple, with response None and error
+          describing the failure if the request failed
+      """
+      start_time = time.perf_counter()
 
-      start_time = time.time()
+      json_body = (body if self._body_bytes is None
+                   and self.method in ["POST", "PUT", "PATCH"] else None)
 
       try:
-          self.response = requests.request(
-              method=self.method,
-              url=self.url,
-              headers=self.headers,
-              json=self.body if self.method in ["POST", "PUT", "PATCH"] else None,
-              params=self.params,
-              timeout=30
-          )
-          self.duration = time.time() - start_time
-          return self.response
+          if self.http2:
+              # Looked up per request since growing the pool replaces it
+              client = _get_http2_client()
+              request = client.build_request(
+                  method=self.method,
+                  url=self.url,
+                  headers=headers,
+                  content=self._body_bytes,
+                  json=json_body,
+                  params=params
+              )
+              response = client.send(request, stream=discard_body)
+              chunks = response.iter_raw(_DISCARD_CHUNK_SIZE) if discard_body else ()
+          else:
+              response = _SESSION.request(
+                  method=self.method,
+                  url=self.url,
+                  headers=headers,
+                  data=self._body_bytes,
+                  json=json_body,
+                  params=params,
+                  timeout=30,
+                  stream=discard_body
+              )
+              chunks = (response.iter_content(chunk_size=_DISCARD_CHUNK_SIZE)
+                        if discard_body else ())
+          if discard_body:
+              # Read to the end so the timing covers the whole response and
+              # the connection can go back to the pool, but keep nothing
+              for _ in chunks:
+                  pass
+              response.close()
       except Exception as e:
-          print(f"Error: {str(e)}")
-          self.duration = time.time() - start_time
-          return None
+          # Only stop the clock here; reporting is left to the caller so
+          # printing never ends up inside the timed section
+          return None, time.perf_counter() - start_time, str(e)
+      return response, time.perf_counter() - start_time, None
+
+  def send_request(self, discard_body: bool = False):
+      """
+      Send a single request and measure response time.
+
+      Args:
+          discard_body: Stream the response body and throw it away instead of
+              buffering it, for when only the status and timing are needed
+
+      Returns:
+          The requests.Response (an httpx.Response when http2 is enabled),
+          or None if the request failed
+      """
+      # Process dynamic content
+      self.prepare_request_data()
+
+      self.response, self.duration, error = self._execute(
+          self.headers, self.body, self.params, discard_body)
+      if error:
+          print(f"Error: {error}")
+      return self.response
+
+  def execute_once(self, scratch=None):
+      """
+      Send one performance-test request with fresh dynamic content.
+
+      Unlike send_request() this leaves the tester's own state untouched, so
+      a single tester can run many of these at once from different threads,
+      each with its own scratch. The response body is discarded.
+
+      Returns:
+          (response, duration, error) tuple, as returned by _execute()
+      """
+      data = self.materialize(scratch)
+      return self._execute(data["headers"], data["body"], data["params"],
+                           discard_body=True)
 
   def run_performance_test(self, num_requests: int = 10, 
-                           concurrent: bool = False) -> Dict[str, Any]:
+                           concurrent: bool = False,
+                           max_workers: int = 64, warmup: int = 3,
+                           tolerance: float = 0.02,
+                           prime_connections: bool = False) -> Dict[str, Any]:
       """
       Run multiple requests and collect performance statistics.
 
       Args:
-          num_requests: Number of requests to send
+          num_requests: Maximum number of measured requests to send
           concurrent: Whether to send requests concurrently
+          max_workers: Maximum number of worker threads in concurrent mode
+          warmup: Number of unmeasured requests sent first to open
+              connections and warm up the server (0 disables)
+          tolerance: In sequential mode, stop early once the running median
+              changes by less than this fraction between checks (0 disables)
+          prime_connections: In concurrent mode, send at least one warmup
+              request per worker, all in flight together, so every worker has
+              its own connection before timing starts
 
       Returns:
           Dictionary with performance statistics
       """
       durations = []
       status_codes = []
+      errors = []
+      requests_sent = num_requests
+      workers = min(num_requests, max_workers)
+      if concurrent:
+          _ensure_pool_size(workers)
+
+      # Warmup requests pay for connection setup and are not measured
+      warmup_requests = warmup
+      warmup_time = 0.0
 
       if concurrent:
-          with ThreadPoolExecutor(max_workers=min(num_requests, 10)) as executor:
-              for _ in range(num_requests):
-                  # Create a new tester with the same configuration (for dynamic content)
-                  tester = APITester(self.url, self.method, 
-                                    self.headers.copy(), 
-                                    self.body.copy(), 
-                                    self.params.copy())
-                  future = executor.submit(tester.send_request)
-                  response = future.result()
-                  if response:
-                      durations.append(tester.duration)
+          # Each worker thread refills its own scratch for every request
+          local = threading.local()
+
+          def execute_in_worker():
+              if not hasattr(local, "scratch"):
+                  local.scratch = self.new_scratch()
+              return self.execute_once(local.scratch)
+
+          if prime_connections:
+              warmup_requests = max(warmup, workers)
+          # The first warmup round waits until each of its workers holds a
+          # request, so they all open their own connection at the same time
+          first_round = min(warmup_requests, workers)
+          barrier = threading.Barrier(first_round or 1, timeout=30)
+
+          def warm_up_worker():
+              try:
+                  barrier.wait()
+              except threading.BrokenBarrierError:
+                  pass
+              return execute_in_worker()
+
+          with ThreadPoolExecutor(max_workers=workers) as executor:
+              if warmup_requests:
+                  warmup_start = time.perf_counter()
+                  warmup_futures = ([executor.submit(warm_up_worker)
+                                     for _ in range(first_round)] +
+                                    [executor.submit(execute_in_worker)
+                                     for _ in range(warmup_requests - first_round)])
+                  wait(warmup_futures)
+                  warmup_time = time.perf_counter() - warmup_start
+
+              # Submit everything before waiting on any result, otherwise each
+              # request blocks the next one and nothing runs concurrently
+              futures = [executor.submit(execute_in_worker)
+                         for _ in range(num_requests)]
+              for future in as_completed(futures):
+                  response, duration, error = future.result()
+                  if response is not None:
+                      durations.append(duration)
                       status_codes.append(response.status_code)
+                  else:
+                      errors.append(error)
       else:
-          for _ in range(num_requests):
-              # Create a new tester with the same configuration (for new dynamic content per request)
-              tester = APITester(self.url, self.method, 
-                                self.headers.copy(), 
-                                self.body.copy(), 
-                                self.params.copy())
-              response = tester.send_request()
-              if response:
-                  durations.append(tester.duration)
+          scratch = self.new_scratch()
+          warmup_start = time.perf_counter()
+          for _ in range(warmup):
+              self.execute_once(scratch)
+          warmup_time = time.perf_counter() - warmup_start
+
+          last_median = None
+          for sent in range(1, num_requests + 1):
+              response, duration, error = self.execute_once(scratch)
+              if response is not None:
+                  durations.append(duration)
                   status_codes.append(response.status_code)
+              else:
+                  errors.append(error)
+
+              # Stop once more requests no longer move the median
+              if tolerance and durations and sent % _MEDIAN_CHECK_INTERVAL == 0:
+                  median = statistics.median(durations)
+                  if last_median and abs(median - last_median) / last_median < tolerance:
+                      requests_sent = sent
+                      break
+                  last_median = median
 
       if not durations:
-          return {"error": "All requests failed"}
+          return {"error": "All requests failed",
+                  "errors": dict(Counter(errors))}
+
+      # Sort once; every order statistic below is then a lookup
+      durations.sort()
 
       return {
           "url": self.url,
           "method": self.method,
-          "requests_sent": num_requests,
+          "requests_sent": requests_sent,
+          "warmup_requests": warmup_requests,
+          "warmup_time": warmup_time,
           "successful_requests": len(durations),
-          "min_time": min(durations),
-          "max_time": max(durations),
-          "avg_time": statistics.mean(durations),
-          "median_time": statistics.median(durations),
-          "status_codes": dict((code, status_codes.count(code)) 
-                              for code in set(status_codes))
+          "min_time": durations[0],
+          "max_time": durations[-1],
+          "avg_time": statistics.fmean(durations),
+          "median_time": _percentile(durations, 50),
+          "p95_time": _percentile(durations, 95),
+          "p99_time": _percentile(durations, 99),
+          "status_codes": dict(Counter(status_codes)),
+          "errors": dict(Counter(errors))
       }
 
   def print_results(self, results: Dict[str, Any]) -> None:
       """Pretty print test results."""
       if "error" in results:
           print(f"Error: {results['error']}")
+          self._print_errors(results)
           return
 
       print("\n=== API Test Results ===")
       print(f"URL: {results['url']}")
       print(f"Method: {results['method']}")
       print(f"Requests sent: {results['requests_sent']}")
+      if results.get("warmup_requests"):
+          print(f"Warmup requests: {results['warmup_requests']} "
+                f"({results['warmup_time']:.4f}s)")
       print(f"Successful requests: {results['successful_requests']}")
 
       # Format timing data
@@ -185,7 +591,9 @@ class APITester:
           ["Minimum", f"{results['min_time']:.4f}s"],
           ["Maximum", f"{results['max_time']:.4f}s"],
           ["Average", f"{results['avg_time']:.4f}s"],
-          ["Median", f"{results['median_time']:.4f}s"]
+          ["Median", f"{results['median_time']:.4f}s"],
+          ["95th percentile", f"{results['p95_time']:.4f}s"],
+          ["99th percentile", f"{results['p99_time']:.4f}s"]
       ]
       print(tabulate(timing_table, tablefmt="simple"))
 
@@ -194,21 +602,34 @@ class APITester:
       status_table = [[code, count] for code, count in results['status_codes'].items()]
       print(tabulate(status_table, headers=["Status Code", "Count"], tablefmt="simple"))
 
+      self._print_errors(results)
+
+  def _print_errors(self, results: Dict[str, Any]) -> None:
+      """Print the distribution of failed requests, if there were any."""
+      if not results.get("errors"):
+          return
+
+      print("\n--- Errors ---")
+      error_table = [[error, count] for error, count in results['errors'].items()]
+      print(tabulate(error_table, headers=["Error", "Count"], tablefmt="simple"))
+
   def save_results(self, results: Dict[str, Any], filename: str) -> None:
       """Save test results to a JSON file."""
-      with open(filename, 'w') as f:
-          json.dump(results, f, indent=2)
+      with open(filename, 'wb') as f:
+          f.write(orjson.dumps(results, option=RESULTS_JSON_OPTIONS))
       print(f"\nResults saved to {filename}")
 
   def print_response_details(self) -> None:
       """Print details about the most recent response."""
-      if not self.response:
+      if self.response is None:
           print("No response available")
           return
 
       print("\n=== Response Details ===")
       print(f"Status Code: {self.response.status_code}")
       print(f"Response Time: {self.duration:.4f}s")
+      if self.http2:
+          print(f"HTTP Version: {self.response.http_version}")
 
       print("\n--- Headers ---")
       for key, value in self.response.headers.items():
@@ -216,6 +637,7 @@ class APITester:
 
       print("\n--- Response Body ---")
       try:
-          print(json.dumps(self.response.json(), indent=2))
-      except:
+          body = orjson.loads(self.response.content)
+          print(orjson.dumps(body, option=orjson.OPT_INDENT_2).decode())
+      except orjson.JSONDecodeError:
           print(self.response.text)
@@ -1,3 +1,4 @@
+import os
 import random
 import string
 import uuid
@@ -23,13 +24,26 @@ class DynamicContentGenerator:
         """Generate a UUID string."""
         return str(uuid.uuid4())
 
+    @staticmethod
+    def generate_uuids(n=10):
+        """Generate a list of n UUID strings from a single block of random bytes."""
+        random_bytes = os.urandom(16 * n)
+        return [str(uuid.UUID(bytes=random_bytes[i:i+16], version=4))
+                for i in range(0, 16 * n, 16)]
+
     @staticmethod
     def generate_email():
         """Generate a random email address."""
-        username = ''.join(random.choice(string.ascii_lowercase) for _ in range(8))
-        domain = ''.join(random.choice(string.ascii_lowercase) for _ in range(6))
+        username = ''.join(random.choices(string.ascii_lowercase, k=8))
+        domain = ''.join(random.choices(string.ascii_lowercase, k=6))
         return f"{username}@{domain}.com"
 
+    @staticmethod
+    def generate_emails(n=10):
+        """Generate a list of n random email addresses with a single RNG call."""
+        chars = ''.join(random.choices(string.ascii_lowercase, k=14 * n))
+        return [f"{chars[i:i+8]}@{chars[i+8:i+14]}.com" for i in range(0, 14 * n, 14)]
+
     @staticmethod
     def generate_phone():
         """Generate a random phone number."""
@@ -1,5 +1,6 @@
 import json
 import argparse
+import importlib.util
 import sys
 from api_tester import APITester
 import template
@@ -26,6 +27,18 @@ def main():
                         help="Number of requests for performance testing")
     parser.add_argument("--concurrent", "-c", action="store_true",
                         help="Send requests concurrently")
+    parser.add_argument("--workers", "-w", type=int, default=64,
+                        help="Maximum number of worker threads for concurrent requests")
+    parser.add_argument("--warmup", type=int, default=3,
+                        help="Number of unmeasured warmup requests to send first")
+    parser.add_argument("--tolerance", type=float, default=0.02,
+                        help="Stop sequential tests early once the median time changes "
+                             "by less than this fraction (0 to always send every request)")
+    parser.add_argument("--prime-connections", action="store_true",
+                        help="In concurrent tests, send at least one warmup request per "
+                             "worker so every worker's connection is open before timing")
+    parser.add_argument("--http2", action="store_true",
+                        help="Multiplex requests over HTTP/2 (requires httpx[http2])")
     parser.add_argument("--output", "-o", help="Save results to this file")
     parser.add_argument("--detail", "-d", action="store_true",
                         help="Show detailed response for a single request")
@@ -40,10 +53,16 @@ def main():
     if args.install_deps:
         print("Installing required dependencies...")
         import subprocess
-        subprocess.call([sys.executable, "-m", "pip", "install", "requests", "tabulate", "lorem-text"])
+        subprocess.call([sys.executable, "-m", "pip", "install", "requests", "tabulate", "lorem-text", "orjson"])
         print("Dependencies installed successfully.")
         return
 
+    # HTTP/2 support comes from optional dependencies
+    if args.http2 and not all(importlib.util.find_spec(name) for name in ("httpx", "h2")):
+        print("Error: --http2 requires httpx with HTTP/2 support.")
+        print("Install it with: pip install \"httpx[http2]\"")
+        return
+
     # Handle template creation
     if args.create_template:
         template.save_config_template(args.create_template)
@@ -101,7 +120,8 @@ def main():
                 return
 
         # Create tester for single route
-        tester = APITester(args.url, args.method, headers, body, params)
+        tester = APITester(args.url, args.method, headers, body, params,
+                           http2=args.http2)
 
         if args.detail:
             # Run a single request and show details
@@ -109,7 +129,9 @@ def main():
             tester.print_response_details()
         else:
             # Run performance test
-            results = tester.run_performance_test(args.requests, args.concurrent)
+            results = tester.run_performance_test(args.requests, args.concurrent,
+                                                  args.workers, args.warmup,
+                                                  args.tolerance, args.prime_connections)
             tester.print_results(results)
 
             if args.output:
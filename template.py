@@ -1,8 +1,24 @@
 import json
 import datetime
+import re
+import orjson
 from typing import Dict, Any
 
-from api_tester import APITester
+from api_tester import APITester, RESULTS_JSON_OPTIONS
+
+
+# Matches "{name}" URL placeholders; anything else with braces is left alone
+_URL_PARAM_PATTERN = re.compile(r"\{([^{}]+)\}")
+
+
+def _apply_url_params(url: str, url_params: Dict[str, Any]) -> str:
+  """Substitute every "{name}" placeholder found in url_params in a single pass."""
+  def substitute(match):
+      name = match.group(1)
+      return str(url_params[name]) if name in url_params else match.group(0)
+
+  return _URL_PARAM_PATTERN.sub(substitute, url)
+
 
 def load_config_file(config_path: str) -> Dict[str, Any]:
   """
@@ -105,7 +121,9 @@ def save_config_template(filename: str) -> None:
   print("  $generate_text(min_words=3, max_words=10) - Generate random text")
   print("  $generate_paragraph() - Generate a paragraph")
   print("  $generate_uuid() - Generate a UUID")
+  print("  $generate_uuids(n=10) - Generate a list of UUIDs")
   print("  $generate_email() - Generate an email address")
+  print("  $generate_emails(n=10) - Generate a list of email addresses")
   print("  $generate_phone() - Generate a phone number")
   print("  $generate_date() - Generate a random date")
   print("  $generate_number(min_val=0, max_val=100) - Generate a random number")
@@ -140,8 +158,7 @@ def run_tests_from_config(config: Dict[str, Any], args) -> None:
 
       # Apply URL parameters if any
       if "urlParams" in route:
-          for param_name, param_value in route["urlParams"].items():
-              url = url.replace(f"{{{param_name}}}", str(param_value))
+          url = _apply_url_params(url, route["urlParams"])
 
       # Merge headers (global + route)
       headers = {**global_headers, **route.get("headers", {})}
@@ -152,7 +169,8 @@ def run_tests_from_config(config: Dict[str, Any], args) -> None:
           method=route.get("method", "GET"),
           headers=headers,
           body=route.get("body", {}),
-          params=route.get("params", {})
+          params=route.get("params", {}),
+          http2=args.http2
       )
 
       if args.detail:
@@ -161,7 +179,9 @@ def run_tests_from_config(config: Dict[str, Any], args) -> None:
           tester.print_response_details()
       else:
           # Run performance test
-          result = tester.run_performance_test(args.requests, args.concurrent)
+          result = tester.run_performance_test(args.requests, args.concurrent,
+                                               args.workers, args.warmup,
+                                               args.tolerance, args.prime_connections)
           result["name"] = route.get("name", f"Route {i+1}")
           tester.print_results(result)
           results.append(result)
@@ -174,6 +194,6 @@ def run_tests_from_config(config: Dict[str, Any], args) -> None:
           "routes": results
       }
 
-      with open(args.output, 'w') as f:
-          json.dump(combined_results, f, indent=2)
+      with open(args.output, 'wb') as f:
+          f.write(orjson.dumps(combined_results, option=RESULTS_JSON_OPTIONS))
       print(f"\nCombined results saved to {args.output}")